@@ -0,0 +1,141 @@
+import io
+import subprocess
+import unittest
+from unittest import mock
+
+from winget_manager import Pkg, parse_winget_output, run_interactive
+
+# 'winget upgrade' output as captured from a pipe: CRLF line endings, a progress
+# spinner drawn with '\r' ahead of the header, and the summary footers after the table
+WINGET_UPGRADE_OUTPUT = (
+    b"   - \r   \\ \r   | \r"
+    b"Name                           Id                            Version        Available      Source\r\n"
+    b"-------------------------------------------------------------------------------------------------\r\n"
+    b"Microsoft Edge                 Microsoft.Edge                120.0.2210.91  121.0.2277.83  winget\r\n"
+    b"Git                            Git.Git                       2.43.0         2.44.0         winget\r\n"
+    b"Microsoft Visual C++ 2015-2\xe2\x80\xa6   Microsoft.VCRedist.2015+.x64  14.38.33130.0  14.38.33135.0  winget\r\n"
+    b"Windows Terminal               9N0DX20HK701                  1.18.3181.0    1.19.10302.0   msstore\r\n"
+    b"4 upgrades available.\r\n"
+    b"1 package(s) have version numbers that cannot be determined. Use --include-unknown to see all results.\r\n"
+)
+
+class ParseWingetOutputTests(unittest.TestCase):
+
+    def test_parses_rows_and_skips_footers(self):
+        self.assertEqual(parse_winget_output(WINGET_UPGRADE_OUTPUT), [
+            Pkg('Microsoft Edge', 'Microsoft.Edge', '120.0.2210.91', '121.0.2277.83'),
+            Pkg('Git', 'Git.Git', '2.43.0', '2.44.0'),
+            Pkg('Microsoft Visual C++ 2015-2…', 'Microsoft.VCRedist.2015+.x64', '14.38.33130.0', '14.38.33135.0'),
+            Pkg('Windows Terminal', '9N0DX20HK701', '1.18.3181.0', '1.19.10302.0'),
+        ])
+
+    def test_footer_is_not_a_package_when_name_column_is_short(self):
+        output = (
+            b"Name   Id         Version Available Source\r\n"
+            b"------------------------------------------\r\n"
+            b"Git    Git.Git    2.40.0  2.41.0    winget\r\n"
+            b"2 upgrades available.\r\n"
+        )
+        self.assertEqual(parse_winget_output(output), [Pkg('Git', 'Git.Git', '2.40.0', '2.41.0')])
+
+    def test_long_footer_is_not_split_into_a_package(self):
+        output = (
+            b"Name   Id         Version Available Source\r\n"
+            b"------------------------------------------\r\n"
+            b"Git    Git.Git    2.40.0  2.41.0    winget\r\n"
+            b"1 package(s) have version numbers that cannot be determined. Use --include-unknown to see all results.\r\n"
+        )
+        self.assertEqual(parse_winget_output(output), [Pkg('Git', 'Git.Git', '2.40.0', '2.41.0')])
+
+    def test_malformed_row_does_not_drop_the_rows_after_it(self):
+        output = (
+            b"Name   Id         Version Available Source\r\n"
+            b"------------------------------------------\r\n"
+            b"Git    Git.Git    2.40.0.1234 2.41.0 winget\r\n"
+            b"Vim    vim.vim    9.0.0   9.1.0     winget\r\n"
+            b"2 upgrades available.\r\n"
+        )
+        self.assertEqual(parse_winget_output(output), [Pkg('Vim', 'vim.vim', '9.0.0', '9.1.0')])
+
+    def test_stops_at_the_next_table(self):
+        output = (
+            b"Name   Id         Version Available Source\r\n"
+            b"------------------------------------------\r\n"
+            b"Git    Git.Git    2.40.0  2.41.0    winget\r\n"
+            b"1 upgrades available.\r\n"
+            b"\r\n"
+            b"The following packages have an upgrade available, but require explicit targeting for upgrade:\r\n"
+            b"Name   Id         Version Available Source\r\n"
+            b"------------------------------------------\r\n"
+            b"Vim    vim.vim    9.0.0   9.1.0     winget\r\n"
+        )
+        self.assertEqual(parse_winget_output(output), [Pkg('Git', 'Git.Git', '2.40.0', '2.41.0')])
+
+    def test_version_with_space_uses_column_offsets(self):
+        output = (
+            b"Name      Id            Version   Available Source\r\n"
+            b"--------------------------------------------------\r\n"
+            b"Foo Tool  Contoso.Foo   < 1.2.3   1.3.0     winget\r\n"
+            b"1 upgrades available.\r\n"
+        )
+        self.assertEqual(parse_winget_output(output), [Pkg('Foo Tool', 'Contoso.Foo', '< 1.2.3', '1.3.0')])
+
+    def test_no_table_yields_nothing(self):
+        self.assertEqual(parse_winget_output(b"No installed package found matching input criteria.\r\n"), [])
+
+class RunInteractiveQueueTests(unittest.TestCase):
+
+    ACCEPT = ['--accept-package-agreements', '--accept-source-agreements']
+
+    def setUp(self):
+        self.packages = [
+            Pkg('Alpha', 'Contoso.Alpha', '1.0', '1.1'),
+            Pkg('Beta', 'Contoso.Beta', '2.0', '2.1'),
+            Pkg('Gamma', 'Contoso.Gamma', '3.0', '3.1'),
+        ]
+
+    def run_menu(self, answers, returncodes=()):
+        """
+        Runs the queueing menu with the given answers, with winget stubbed out.
+        Returns the stubbed subprocess.run so the winget calls can be checked.
+        """
+        results = [subprocess.CompletedProcess([], code) for code in returncodes]
+        with mock.patch('subprocess.run', side_effect=results) as winget, \
+                mock.patch('builtins.input', side_effect=answers), \
+                mock.patch('sys.stdout', new_callable=io.StringIO) as stdout:
+            run_interactive(self.packages, queue_selections=True)
+        self.output = stdout.getvalue()
+        return winget
+
+    def test_picking_twice_unqueues(self):
+        winget = self.run_menu(['1', '1', '2', 'a', 'c'], returncodes=[0])
+        winget.assert_called_once_with(
+            ['winget', 'upgrade', '--id', 'Contoso.Beta', *self.ACCEPT], check=False, shell=False)
+        self.assertEqual([pkg.id for pkg in self.packages], ['Contoso.Alpha', 'Contoso.Gamma'])
+
+    def test_apply_upgrades_queued_packages_in_one_run(self):
+        winget = self.run_menu(['3', '1', 'a', 'c'], returncodes=[0])
+        winget.assert_called_once_with(
+            ['winget', 'upgrade', 'Contoso.Alpha', 'Contoso.Gamma', '--exact', *self.ACCEPT],
+            check=False, shell=False)
+        self.assertEqual([pkg.id for pkg in self.packages], ['Contoso.Beta'])
+
+    def test_failed_apply_keeps_list_and_queue(self):
+        winget = self.run_menu(['1', '2', 'a', 'a', 'c'], returncodes=[1, 0])
+        batch = ['winget', 'upgrade', 'Contoso.Alpha', 'Contoso.Beta', '--exact', *self.ACCEPT]
+        # The second 'A' retries the same queue, which the first, failed run left in place
+        self.assertEqual(winget.call_args_list, [mock.call(batch, check=False, shell=False)] * 2)
+        self.assertEqual([pkg.id for pkg in self.packages], ['Contoso.Gamma'])
+
+    def test_apply_with_empty_queue_runs_nothing(self):
+        winget = self.run_menu(['a', 'c'])
+        winget.assert_not_called()
+        self.assertEqual(len(self.packages), 3)
+
+    def test_invalid_input_mentions_apply(self):
+        self.run_menu(['9', 'x', 'c'])
+        self.assertIn("between 1 and 3, 0, 'A', or 'C'.", self.output)
+        self.assertIn("(0 or 1-3), 'A', or 'C'.", self.output)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,476 @@
+# subprocess is imported where it is used, so the non-Windows
+# early exit and plain imports of the parser don't pay for loading it
+import sys
+from typing import Container, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple, Union
+
+# Prefixes of the line winget draws between the header and the package rows
+_SEP_PREFIX = (b'---', b'====')
+# Columns without header offsets are separated by at least this much padding
+_COL_GAP = b'  '
+# Accepted answers to the yes/no confirmation prompt
+_YES = frozenset({'y', 'yes'})
+_NO = frozenset({'n', 'no'})
+
+class Pkg(NamedTuple):
+    """
+    One upgradable package as listed by 'winget upgrade'.
+    """
+    name: str
+    id: str
+    version: str
+    available: str
+
+def _column_bounds(header: str) -> List[Tuple[int, Optional[int]]]:
+    """
+    Computes the (start, end) offsets of each column from the winget header line.
+    A column starts wherever a header word follows a space; the last column is open-ended.
+    """
+    starts: List[int] = []
+    prev_char = ' '
+    for i, char in enumerate(header):
+        if char != ' ' and prev_char == ' ':
+            starts.append(i)
+        prev_char = char
+    ends: List[Optional[int]] = list(starts[1:])
+    ends.append(None)
+    return list(zip(starts, ends))
+
+def _split_columns(line: bytes) -> List[bytes]:
+    """
+    Splits a row on runs of 2 or more spaces without using a regex.
+    Only used when the column offsets could not be taken from the header.
+    """
+    parts: List[bytes] = []
+    for chunk in line.split(_COL_GAP):
+        chunk = chunk.strip()
+        if chunk:
+            parts.append(chunk)
+    return parts
+
+def _fits_columns(row: Union[bytes, str], bounds: List[Tuple[int, Optional[int]]]) -> bool:
+    """
+    Checks that a row sliced by the header offsets really belongs to the table:
+    every column boundary falls on a space and the columns after Version are filled in.
+    """
+    for start, _ in bounds[1:]:
+        if not row[start - 1:start].isspace():
+            return False
+    for start, end in bounds[3:]:
+        if not row[start:end].strip():
+            return False
+    return True
+
+def _tokens_fit(row: Union[bytes, str], parts: Union[List[bytes], List[str]], id_col: int, source_col: int) -> bool:
+    """
+    Checks that the Id and Source tokens of a right-split row sit under their header columns.
+    A wide name can pull every later column left by the same amount, but only in non-ASCII rows.
+    """
+    id_start = len(row) - len(row[len(parts[0]):].lstrip())
+    source_start = len(row) - len(parts[4])
+    shift = id_col - id_start
+    if shift != source_col - source_start:
+        return False
+    return shift == 0 if isinstance(row, bytes) else shift >= 0
+
+def _decode(field: Union[bytes, str]) -> str:
+    """
+    Decodes a single field of winget output; fields sliced from a decoded row are already text.
+    """
+    if isinstance(field, str):
+        return field
+    return field.decode('utf-8', 'replace')
+
+def parse_winget_lines(lines: Iterable[bytes]) -> Iterator[Pkg]:
+    """
+    Parses the raw byte lines of 'winget upgrade' output as they arrive, yielding one
+    Pkg(name, id, version, available) per upgradable package.
+    Lines that don't fit the table's columns, such as the 'N upgrades available.' footer,
+    are skipped; parsing stops at the next separator line, where a second table would start.
+    Only the kept fields are decoded; the structural scan runs on bytes.
+    """
+    rows = iter(lines)
+    header = b''
+
+    # State 1: find the header separator line (usually '---' or '====') to determine where data starts
+    for line in rows:
+        if line.strip().startswith(_SEP_PREFIX):
+            break
+        header = line
+    else:
+        return
+
+    # Winget columns are fixed-width, so take the offsets once from the header line.
+    # The header may be preceded by a progress spinner drawn with '\r', so only keep the text after it.
+    header = header.rstrip().rsplit(b'\r', 1)[-1]
+    bounds = _column_bounds(header.decode('utf-8', 'replace'))
+    # Splitting from the right is only safe when every row ends in all five columns;
+    # without a Source column, a multi-word name would shift into the Id
+    rsplit_rows = len(bounds) == 5
+    use_bounds = len(bounds) >= 4
+    if use_bounds:
+        (s0, e0), (s1, e1), (s2, e2), (s3, e3) = bounds[:4]
+        s4 = bounds[-1][0]
+
+    name: Union[bytes, str]
+    pkg_id: Union[bytes, str]
+    version: Union[bytes, str]
+    available: Union[bytes, str]
+    row: Union[bytes, str]
+    parts: Union[List[bytes], List[str]]
+
+    # State 2: the rest of the same iterator holds the package rows
+    for line in rows:
+        # Every package row carries a dotted version or id, so a cheap substring test
+        # skips blank lines, banners and progress output before any slicing work.
+        # Separator lines have no dot either, so they are only looked for in here
+        if b'.' not in line:
+            if line.strip().startswith(_SEP_PREFIX):
+                return
+            continue
+        line = line.rstrip()
+        if line.startswith(b'Found'):
+            continue
+
+        row = line
+        if not line.isascii():
+            # Offsets count characters, so rows with multi-byte names (e.g. a truncating '…')
+            # are decoded before they are split or sliced to keep the later columns aligned
+            row = line.decode('utf-8', 'replace')
+
+        # Output columns are typically: Name | Id | Version | Available | Source.
+        # Only the name may contain spaces, so the last four whitespace-separated tokens are
+        # Id | Version | Available | Source, as long as the Id and Source tokens sit under
+        # their header columns. Rows where they don't, such as a version with a space in it
+        # (e.g. '< 1.2.3'), use the column offsets instead
+        parts = row.rsplit(None, 4) if rsplit_rows else []
+        if len(parts) == 5 and _tokens_fit(row, parts, s1, s4):
+            name, pkg_id, version, available = parts[:4]
+        elif use_bounds:
+            if not _fits_columns(row, bounds):
+                continue
+            name = row[s0:e0].rstrip()
+            pkg_id = row[s1:e1].rstrip()
+            version = row[s2:e2].rstrip()
+            available = row[s3:e3].rstrip()
+        else:
+            parts = _split_columns(line)
+            if len(parts) < 5:
+                continue
+            name, pkg_id, version, available = parts[:4]
+
+        if not (name and pkg_id):
+            continue
+        yield Pkg(_decode(name), _decode(pkg_id), _decode(version), _decode(available))
+
+def parse_winget_output(output: bytes) -> List[Pkg]:
+    """
+    Parses the raw (bytes) output of 'winget upgrade' to extract a list of upgradable packages.
+    Returns a list of Pkg tuples: [Pkg(name='...', id='...', ...), ...]
+    """
+    return list(parse_winget_lines(output.split(b'\n')))
+
+def _index_width(packages: List[Pkg]) -> int:
+    """
+    Returns the width of the index column: at least 2, wider once there are 100+ packages.
+    """
+    return max(2, len(str(len(packages))))
+
+def _format_rows(packages: List[Pkg], width: int, queued: Container[str] = ()) -> str:
+    """
+    Renders the numbered package list, one row per package, with the index padded to width.
+    Packages whose id is in queued are marked with an asterisk.
+    """
+    return "\n".join(f"[{i:>{width}}]{'*' if pkg.id in queued else ' '}{pkg.name} (ID: {pkg.id}) - {pkg.version} -> {pkg.available}"
+                      for i, pkg in enumerate(packages, 1))
+
+def _format_menu(packages: List[Pkg], queued: Optional[Set[str]] = None) -> str:
+    """
+    Renders the numbered package list and the menu options as one string,
+    so the whole table is written once and only rebuilt when the list changes.
+    Passing a queued set (even an empty one) adds the option to apply the queue.
+    """
+    width = _index_width(packages)
+    apply_option = "" if queued is None else f"[{'A':>{width}}] APPLY the queued (*) upgrades in one winget run.\n"
+    return (
+        "\n" + "="*70 + "\n"
+        "AVAILABLE PACKAGE UPGRADES:\n"
+        + "="*70 + "\n"
+        + _format_rows(packages, width, queued or ()) + "\n"
+        "\n" + "-"*70 + "\n"
+        f"[{'0':>{width}}] UPGRADE ALL listed packages.\n"
+        + apply_option +
+        f"[{'C':>{width}}] Cancel/Stop and exit the script.\n"
+        + "-"*70 + "\n"
+    )
+
+def _format_prompt(packages: List[Pkg], queued: Optional[Set[str]] = None) -> str:
+    """
+    Renders the input prompt for the selection menu.
+    """
+    if queued is None:
+        return f"Enter option [0-{len(packages)}], or 'C' to cancel: "
+    return f"Enter option [0-{len(packages)}] to queue/unqueue, 'A' to apply, or 'C' to cancel: "
+
+def _format_errors(packages: List[Pkg], queued: Optional[Set[str]] = None) -> Tuple[str, str]:
+    """
+    Renders the messages for an out-of-range number and for unrecognised input,
+    listing the same commands as _format_prompt.
+    """
+    if queued is None:
+        return (f"Invalid option. Please enter a number between 1 and {len(packages)}, 0, or 'C'.",
+                f"Invalid input. Please enter a number (0 or 1-{len(packages)}) or 'C'.")
+    return (f"Invalid option. Please enter a number between 1 and {len(packages)}, 0, 'A', or 'C'.",
+            f"Invalid input. Please enter a number (0 or 1-{len(packages)}), 'A', or 'C'.")
+
+def _live_output() -> None:
+    """
+    Switches stdout to line buffering before winget writes straight to the console, so our
+    status lines are never held back behind its output when stdout is redirected.
+    Reconfiguring flushes anything already buffered; it is left on since the script exits soon after.
+    """
+    reconfigure = getattr(sys.stdout, 'reconfigure', None)
+    if reconfigure is not None:
+        reconfigure(line_buffering=True)
+    else:
+        sys.stdout.flush()
+
+def _upgrade_ids(pkg_ids: List[str]) -> int:
+    """
+    Upgrades the given package ids with a single winget invocation, so winget's startup
+    and source refresh are paid once rather than once per package. Returns winget's exit code.
+    A single id uses '--id'; several ids are passed as exact positional queries,
+    which is how winget (1.6+) takes multiple packages in one run.
+    """
+    import subprocess
+
+    _live_output()
+    if len(pkg_ids) == 1:
+        query_args = ['--id', pkg_ids[0]]
+    else:
+        query_args = [*pkg_ids, '--exact']
+    result = subprocess.run(
+        ['winget', 'upgrade', *query_args, '--accept-package-agreements', '--accept-source-agreements'],
+        check=False,
+        shell=False
+    )
+    return result.returncode
+
+def _upgrade_all() -> None:
+    """
+    Runs 'winget upgrade --all' without capturing its output, so the user can see the live install progress.
+    """
+    import subprocess
+
+    _live_output()
+    print("\n--- Starting 'winget upgrade --all'. This may take a while... ---")
+    subprocess.run(
+        ['winget', 'upgrade', '--all', '--accept-package-agreements', '--accept-source-agreements'],
+        check=False,
+        shell=False
+    )
+    print("\n--- Winget upgrade process finished. ---")
+
+def get_upgrades() -> Tuple[List[Pkg], str]:
+    """
+    Runs 'winget upgrade' and parses its output while it is being written.
+    Returns a tuple of (packages, stderr), where packages is the list produced by parse_winget_lines.
+    """
+    import subprocess
+    import threading
+
+    # The table is scraped because 'winget upgrade' has no machine-readable output format.
+    # 'winget export' writes JSON but only lists installed ids, without the available versions,
+    # and probing for an unsupported '--format json' would cost an extra winget start-up per run.
+    # Keep the default buffer size (bufsize=-1); unbuffered pipes read one byte per syscall
+    proc = subprocess.Popen(
+        ['winget', 'upgrade'],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=-1,
+        shell=False
+    )
+
+    stdout_pipe, stderr_pipe = proc.stdout, proc.stderr
+    assert stdout_pipe is not None and stderr_pipe is not None
+
+    with proc:
+        # Drain stderr on a thread while stdout is parsed, so winget never blocks on a full stderr pipe
+        stderr_chunks: List[bytes] = []
+        stderr_reader = threading.Thread(target=lambda: stderr_chunks.append(stderr_pipe.read()), daemon=True)
+        stderr_reader.start()
+
+        packages = list(parse_winget_lines(stdout_pipe))
+        # The parser stops at the end of the table; drain the rest line by line, without
+        # keeping it, so winget can finish writing
+        for _ in stdout_pipe:
+            pass
+
+        stderr_reader.join()
+        stderr = b''.join(stderr_chunks).decode('utf-8', 'replace')
+
+    return packages, stderr
+
+def run_all(packages: List[Pkg]) -> None:
+    """
+    Displays the list of upgradable packages and prompts the user
+    to run 'winget upgrade --all' for full system update.
+    """
+    print(_format_rows(packages, _index_width(packages)))
+
+    # Each banner is written with one print call rather than one per line
+    print("\n" + "="*70 + "\n"
+          "Do you want to proceed with installing ALL the listed upgrades?\n"
+          "This will execute 'winget upgrade --all'.\n"
+          + "="*70)
+
+    # Prompt the user for confirmation
+    while True:
+        user_input = input("Enter yes or y to proceed with the upgrade, or no or n to exit: ").strip().lower()
+
+        if user_input in _YES:
+            _upgrade_all()
+            return
+
+        elif user_input in _NO:
+            print("\nOperation canceled by user. No packages were upgraded.")
+            return
+
+        else:
+            print("Invalid input. Please enter 'yes' or 'no'.")
+
+def run_interactive(packages: List[Pkg], queue_selections: bool = False) -> None:
+    """
+    Displays a numbered list of upgradable packages and lets the user upgrade all of them,
+    pick individual ones, or cancel. The list is modified in place.
+    By default each pick is upgraded immediately; with queue_selections, picked packages
+    are queued and upgraded together with 'A'.
+    """
+    queued: Optional[Set[str]] = set() if queue_selections else None
+
+    # The menu and prompt are only rebuilt after the list or the queue changes
+    menu = _format_menu(packages, queued)
+    prompt = _format_prompt(packages, queued)
+    option_error, input_error = _format_errors(packages, queued)
+    while True:
+        # Display the numbered list of packages in a single write
+        sys.stdout.write(menu)
+        sys.stdout.flush()
+
+        user_input = input(prompt).strip()
+        command = user_input.lower()
+
+        if command == 'c':
+            print("\nOperation canceled by user. Exiting.")
+            return
+
+        if user_input == '0':
+            _upgrade_all()
+            return
+
+        if queued is not None and command == 'a':
+            if not queued:
+                print("No packages are queued. Enter a package number to queue it first.")
+                continue
+
+            # Keep the displayed order for the upgrade run
+            selected = [pkg for pkg in packages if pkg.id in queued]
+            print(f"\n--- Starting upgrade for {len(selected)} queued package(s): "
+                  f"{', '.join(pkg.name for pkg in selected)} ---")
+            if _upgrade_ids([pkg.id for pkg in selected]) != 0:
+                # Keep the list and the queue as they were, since winget may not have upgraded any of them
+                print("\n--- Winget reported an error; the queued packages were kept in the list. ---")
+                continue
+            print("\n--- Upgrade finished for the queued packages. ---")
+
+            packages[:] = [pkg for pkg in packages if pkg.id not in queued]
+            queued.clear()
+
+            if not packages:
+                print("\nAll packages in the original list have been upgraded. Exiting.")
+                return
+
+            menu = _format_menu(packages, queued)
+            prompt = _format_prompt(packages, queued)
+            option_error, input_error = _format_errors(packages, queued)
+            continue
+
+        try:
+            selection_index = int(user_input)
+            if 1 <= selection_index <= len(packages):
+                selected_pkg = packages[selection_index - 1]
+                pkg_id = selected_pkg.id
+
+                if queued is not None:
+                    # Toggle the package in the queue; nothing runs until 'A'
+                    if pkg_id in queued:
+                        queued.discard(pkg_id)
+                    else:
+                        queued.add(pkg_id)
+                    menu = _format_menu(packages, queued)
+                    continue
+
+                print(f"\n--- Starting upgrade for: {selected_pkg.name} (ID: {pkg_id}) ---")
+
+                # Execute upgrade for the selected package
+                _upgrade_ids([pkg_id])
+
+                print(f"\n--- Upgrade finished for {selected_pkg.name}. ---")
+
+                # Remove the successful upgrade from the list and continue. The last entry is moved
+                # into its slot so the removal doesn't shift every later row; the menu is re-numbered anyway
+                packages[selection_index - 1] = packages[-1]
+                packages.pop()
+
+                if not packages:
+                    print("\nAll packages in the original list have been upgraded. Exiting.")
+                    return
+
+                menu = _format_menu(packages, queued)
+                prompt = _format_prompt(packages, queued)
+                option_error, input_error = _format_errors(packages, queued)
+
+            else:
+                print(option_error)
+
+        except ValueError:
+            print(input_error)
+
+def run(interactive_select: bool = False, queue_selections: bool = False) -> None:
+    """
+    Checks for available winget upgrades and hands the list to run_interactive
+    when interactive_select is set, or to run_all otherwise.
+    queue_selections is passed on to run_interactive.
+    """
+    # Check if the operating system is Windows
+    if sys.platform != 'win32':
+        print("This script is designed to run on Windows and requires the winget utility.")
+        return
+
+    print("--- Running 'winget upgrade' to check for available updates... ---\n")
+
+    try:
+        packages, stderr = get_upgrades()
+
+        if not packages:
+            print("\n----------------------------------------------------\n"
+                  "Winget reported: No package upgrades are currently available.\n"
+                  "----------------------------------------------------")
+            return
+
+        # Print any warnings/errors that occurred during the check
+        if stderr and "No package found matching input" not in stderr:
+            print(f"\n[Warning/Error from winget check]:\n{stderr.strip()}")
+
+        if interactive_select:
+            run_interactive(packages, queue_selections)
+        else:
+            run_all(packages)
+
+    except FileNotFoundError:
+        print("\nERROR: 'winget' command not found. Ensure winget is installed and in your system PATH.\n"
+              "Winget is usually included with modern versions of Windows 10/11.")
+    except Exception as e:
+        print(f"\nAn unexpected error occurred: {e}")
+
+if __name__ == "__main__":
+    run(interactive_select=True, queue_selections='--queue' in sys.argv[1:])